@@ -3,11 +3,13 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 
+import functools
 import h5py
 import os
 import simplejson
 import traceback
 from tornado import web
+from tornado.ioloop import IOLoop
 from tornado.httpclient import HTTPError
 
 from notebook.base.handlers import APIHandler
@@ -15,6 +17,7 @@ from notebook.utils import url_path_join
 
 # from .config import HdfConfig
 from .exception import JhdfError
+from .util import jsonDefault
 
 __all__ = ["HdfBaseManager", "HdfFileManager", "HdfBaseHandler"]
 
@@ -43,7 +46,7 @@ class HdfBaseManager:
             if isinstance(msg, dict):
                 # encode msg as json
                 msg["debugVars"] = {**msg.get("debugVars", {}), **extra}
-                msg = simplejson.dumps(msg, ignore_nan=True)
+                msg = simplejson.dumps(msg, default=jsonDefault, ignore_nan=True)
             else:
                 msg = "\n".join((msg, ", ".join(f"{key}: {val}" for key, val in extra.items())))
 
@@ -61,22 +64,22 @@ class HdfBaseManager:
             _handleErr(403, msg)
         else:
             try:
-                # test opening the file with h5py
-                with h5py.File(fpath, "r") as f:
-                    pass
+                # open the file once, and hand the open file to the manager
+                f = h5py.File(fpath, "r")
             except Exception as e:
                 msg = f"The request did not specify a file that `h5py` could understand.\n" f"Error: {traceback.format_exc()}"
                 _handleErr(401, msg)
-            try:
-                out = self._get(fpath, uri, **kwargs)
-            except JhdfError as e:
-                msg = e.args[0]
-                msg["traceback"] = traceback.format_exc()
-                msg["type"] = "JhdfError"
-                _handleErr(400, msg)
-            except Exception as e:
-                msg = f"Found and opened file, error getting contents from object specified by the uri.\n" f"Error: {traceback.format_exc()}"
-                _handleErr(500, msg)
+            with f:
+                try:
+                    out = self._get(f, uri, **kwargs)
+                except JhdfError as e:
+                    msg = e.args[0]
+                    msg["traceback"] = traceback.format_exc()
+                    msg["type"] = "JhdfError"
+                    _handleErr(400, msg)
+                except Exception as e:
+                    msg = f"Found and opened file, error getting contents from object specified by the uri.\n" f"Error: {traceback.format_exc()}"
+                    _handleErr(500, msg)
 
             return out
 
@@ -84,9 +87,8 @@ class HdfBaseManager:
 class HdfFileManager(HdfBaseManager):
     """Implements base HDF5 file handling"""
 
-    def _get(self, fpath, uri, **kwargs):
-        with h5py.File(fpath, "r") as f:
-            return self._getFromFile(f, uri, **kwargs)
+    def _get(self, f, uri, **kwargs):
+        return self._getFromFile(f, uri, **kwargs)
 
     def _getFromFile(self, f, uri, **kwargs):
         raise NotImplementedError
@@ -133,7 +135,13 @@ class HdfBaseHandler(APIHandler):
             kwargs[k] = int(kwargs[k])
 
         try:
-            self.finish(simplejson.dumps(self.manager.get(path, uri, **kwargs), ignore_nan=True))
+            # run the blocking hdf5 work on a worker thread, so that the server's
+            # event loop stays free to handle other requests in the meantime
+            out = await IOLoop.current().run_in_executor(None, functools.partial(self.manager.get, path, uri, **kwargs))
+
+            # serialize straight from the manager's output, converting any numpy/h5py
+            # values on the fly rather than building a jsonized copy first
+            self.finish(simplejson.dumps(out, default=jsonDefault, ignore_nan=True))
         except HTTPError as err:
             self.set_status(err.code)
             response = err.response.body if err.response else str(err.code)
@@ -6,7 +6,7 @@
 import h5py
 
 from .baseHandler import HdfFileManager, HdfBaseHandler
-from .util import hobjContentsDict, jsonize, uriJoin, uriName
+from .util import groupContentsDicts, hobjContentsDict
 
 __all__ = ['HdfContentsManager', 'HdfContentsHandler']
 
@@ -19,22 +19,14 @@ class HdfContentsManager(HdfFileManager):
 
         if isinstance(hobj, h5py.Group):
             # recurse one level
-            return [
-                jsonize(hobjContentsDict(
-                    subhobj,
-                    content=False,
-                    ixstr=ixstr,
-                    min_ndim=min_ndim,
-                ))
-                for subhobj in hobj.values()
-            ]
+            return groupContentsDicts(hobj)
         else:
-            return jsonize(hobjContentsDict(
+            return hobjContentsDict(
                 hobj,
                 content=True,
                 ixstr=ixstr,
                 min_ndim=min_ndim,
-            ))
+            )
 
 ## handler
 class HdfContentsHandler(HdfBaseHandler):
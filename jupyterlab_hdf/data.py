@@ -8,7 +8,7 @@ try:
 except ImportError:
     pass
 from .baseHandler import HdfFileManager, HdfBaseHandler
-from .util import dsetChunk, jsonize
+from .util import dsetChunk
 
 __all__ = ['HdfDataManager', 'HdfDataHandler']
 
@@ -25,7 +25,7 @@ class HdfDataManager(HdfFileManager):
         #     logd['ixcompound'] = parseSubindex(ixstr, subixstr, f[uri].shape)
         # self.log.info('{}'.format(logd))
 
-        return jsonize(dsetChunk(f[uri], ixstr=ixstr, subixstr=subixstr, min_ndim=min_ndim))
+        return dsetChunk(f[uri], ixstr=ixstr, subixstr=subixstr, min_ndim=min_ndim)
 
 ## handler
 class HdfDataHandler(HdfBaseHandler):
@@ -4,7 +4,7 @@
 # Distributed under the terms of the Modified BSD License.
 
 from .baseHandler import HdfFileManager, HdfBaseHandler
-from .util import hobjMetaDict, jsonize
+from .util import hobjMetaDict
 
 __all__ = ['HdfMetaManager', 'HdfMetaHandler']
 
@@ -13,7 +13,7 @@ class HdfMetaManager(HdfFileManager):
     """Implements HDF5 metadata handling
     """
     def _getFromFile(self, f, uri, ixstr=None, min_ndim=None, **kwargs):
-        return jsonize(hobjMetaDict(f[uri], ixstr=ixstr, min_ndim=min_ndim))
+        return hobjMetaDict(f[uri], ixstr=ixstr, min_ndim=min_ndim)
 
 ## handler
 class HdfMetaHandler(HdfBaseHandler):
@@ -3,8 +3,6 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 
-import h5py
-
 from .baseHandler import HdfBaseManager, HdfBaseHandler
 from .util import hobjType
 
@@ -23,9 +21,9 @@ ixTemplate = '''[{ixstr}]'''
 class HdfSnippetManager(HdfBaseManager):
     """Implements HDF5 contents handling
     """
-    def _get(self, fpath, uri, ixstr=None, subixstr=None, **kwargs):
-        with h5py.File(fpath, 'r') as f:
-            tipe = hobjType(f[uri])
+    def _get(self, f, uri, ixstr=None, subixstr=None, **kwargs):
+        fpath = f.filename
+        tipe = hobjType(f[uri])
 
         if tipe == 'dataset':
             return ''.join((
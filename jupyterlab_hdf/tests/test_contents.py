@@ -19,6 +19,18 @@ class TestContents(ServerTest):
             # and a group
             grp.create_group("nested_group")
 
+            # Group with one child of each kind
+            kinds_grp = h5file.create_group("group_with_all_kinds")
+            kinds_grp["dataset"] = np.arange(3)
+            kinds_grp.create_group("group")
+            kinds_grp["named_datatype"] = np.dtype("<i4")
+            kinds_grp["soft_link"] = h5py.SoftLink("/group_with_children/nested_group")
+            kinds_grp["external_link"] = h5py.ExternalLink(os.path.join(self.notebook_dir, "external_file.h5"), "/deep/target")
+            kinds_grp["données"] = np.arange(3)
+
+        with h5py.File(os.path.join(self.notebook_dir, "external_file.h5"), "w") as h5file:
+            h5file.create_group("deep/target")
+
     def test_empty_group(self):
         response = self.tester.get(["contents", "test_file.h5"], params={"uri": "/empty_group"})
 
@@ -36,6 +48,21 @@ class TestContents(ServerTest):
             dict((("name", "nested_group"), ("type", "group"), ("uri", "/group_with_children/nested_group"))),
         ]
 
+    def test_group_with_all_kinds(self):
+        response = self.tester.get(["contents", "test_file.h5"], params={"uri": "/group_with_all_kinds"})
+
+        assert response.status_code == 200
+        payload = response.json()
+        # links are listed under their own name and uri in this file, with the type of their target
+        assert payload == [
+            dict((("name", "dataset"), ("type", "dataset"), ("uri", "/group_with_all_kinds/dataset"))),
+            dict((("name", "données"), ("type", "dataset"), ("uri", "/group_with_all_kinds/données"))),
+            dict((("name", "external_link"), ("type", "group"), ("uri", "/group_with_all_kinds/external_link"))),
+            dict((("name", "group"), ("type", "group"), ("uri", "/group_with_all_kinds/group"))),
+            dict((("name", "named_datatype"), ("type", "other"), ("uri", "/group_with_all_kinds/named_datatype"))),
+            dict((("name", "soft_link"), ("type", "group"), ("uri", "/group_with_all_kinds/soft_link"))),
+        ]
+
     def test_full_dataset(self):
         uri = "/group_with_children/dataset_1"
         response = self.tester.get(["contents", "test_file.h5"], params={"uri": uri})
@@ -1,6 +1,8 @@
 import h5py
 import os
 import numpy as np
+import pytest
+import requests
 from jupyterlab_hdf.tests.utils import ServerTest
 
 
@@ -53,6 +55,25 @@ class TestData(ServerTest):
         payload = response.json()
         assert payload == sliced_dataset.tolist()
 
+    def test_subsliced_threeD_dataset(self):
+        ixstr = ":, 1:3, 2"
+        sliced_dataset = THREE_D[:, 1:3, 2]
+        # several subslices of the same slice, as requested by the frontend when scrolling
+        for subixstr, subsliced_dataset in (("0:1, 1:2", sliced_dataset[0:1, 1:2]), ("1:2, 0:2", sliced_dataset[1:2, 0:2])):
+            response = self.tester.get(["data", "test_file.h5"], params={"uri": "/threeD_dataset", "ixstr": ixstr, "subixstr": subixstr})
+
+            assert response.status_code == 200
+            payload = response.json()
+            assert payload == subsliced_dataset.tolist()
+
+    def test_malformed_subixstr(self):
+        # the slice has 2 visible dimensions, but the subindex only 1
+        with pytest.raises(requests.HTTPError) as excinfo:
+            self.tester.get(["data", "test_file.h5"], params={"uri": "/threeD_dataset", "ixstr": ":, 1:3, 2", "subixstr": "0:1"})
+
+        assert excinfo.value.response.status_code == 400
+        assert "JhdfError" in excinfo.value.response.text
+
     def test_complex_dataset(self):
         response = self.tester.get(["data", "test_file.h5"], params={"uri": "/complex"})
 
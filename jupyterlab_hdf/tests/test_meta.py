@@ -24,6 +24,17 @@ class TestMeta(ServerTest):
             attr_grp.attrs["number_attr"] = np.int32(5676)
             attr_grp.attrs["string_attr"] = "I am a group"
 
+            # Groups with attributes created out of name order, one of them tracking creation order
+            for grp_name, track_order in (("group_with_unsorted_attrs", False), ("group_with_tracked_attrs", True)):
+                unsorted_grp = h5file.create_group(grp_name, track_order=track_order)
+                for attr_name in ("zeta", "b_attr", "été", "Alpha", "a10", "a2"):
+                    unsorted_grp.attrs[attr_name] = np.int32(0)
+            # and a group with enough attributes to switch to dense attribute storage
+            # (tracking creation order gives it the object header version that supports it)
+            dense_grp = h5file.create_group("group_with_dense_attrs", track_order=True)
+            for i in reversed(range(12)):
+                dense_grp.attrs[f"attr_{i:02d}"] = np.int32(i)
+
             # Scalar dataset
             h5file["scalar"] = 56
 
@@ -66,6 +77,22 @@ class TestMeta(ServerTest):
         ]
         assert payload["childrenCount"] == 0
 
+    def test_group_with_unsorted_attrs(self):
+        for uri in ("/group_with_unsorted_attrs", "/group_with_tracked_attrs"):
+            response = self.tester.get(["meta", "test_file.h5"], params={"uri": uri})
+
+            assert response.status_code == 200
+            payload = response.json()
+            # attributes are sorted by name, whatever their creation order
+            assert [attr["name"] for attr in payload["attributes"]] == ["Alpha", "a10", "a2", "b_attr", "zeta", "été"]
+            assert all(attr["dtype"] == "<i4" and attr["shape"] == [] for attr in payload["attributes"])
+
+        response = self.tester.get(["meta", "test_file.h5"], params={"uri": "/group_with_dense_attrs"})
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert [attr["name"] for attr in payload["attributes"]] == [f"attr_{i:02d}" for i in range(12)]
+
     def test_full_dataset(self):
         response = self.tester.get(["meta", "test_file.h5"], params={"uri": "/group_with_children/dataset_1"})
 
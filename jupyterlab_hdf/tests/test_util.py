@@ -0,0 +1,49 @@
+import h5py
+import numpy as np
+import pytest
+import simplejson
+from jupyterlab_hdf.util import jsonDefault, jsonize
+
+
+def test_jsonDefault_numpy_scalar():
+    converted = jsonDefault(np.int32(5))
+
+    assert converted == 5
+    assert type(converted) is int
+
+
+def test_jsonDefault_numpy_array():
+    assert jsonDefault(np.arange(6).reshape(2, 3)) == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_jsonDefault_slice():
+    assert jsonDefault(slice(1, 5, 2)) == {"start": 1, "stop": 5, "step": 2}
+
+
+def test_jsonDefault_complex():
+    assert jsonDefault(1 + 2j) == [1.0, 2.0]
+
+
+def test_jsonDefault_empty():
+    assert jsonDefault(h5py.Empty(">f8")) is None
+
+
+def test_jsonDefault_unsupported():
+    with pytest.raises(TypeError):
+        jsonDefault(object())
+
+
+def test_jsonDefault_bytes_and_nan():
+    value = [b"bytes", float("nan"), np.float64("nan"), np.array([np.nan, 1], dtype=np.float32)]
+
+    encoded = simplejson.dumps(value, default=jsonDefault, ignore_nan=True)
+
+    assert encoded == '["bytes", null, null, [null, 1.0]]'
+    # same encoding as the jsonize path
+    assert encoded == simplejson.dumps(jsonize(value), ignore_nan=True)
+
+
+def test_jsonDefault_nested():
+    value = {"labels": [slice(0, 2, 1)], "data": np.array([1 + 1j, 2j]), "size": np.int64(2), "empty": h5py.Empty(">f8")}
+
+    assert simplejson.dumps(value, default=jsonDefault, ignore_nan=True) == simplejson.dumps(jsonize(value), ignore_nan=True)
@@ -4,13 +4,14 @@
 # Distributed under the terms of the Modified BSD License.
 
 import ast
+import functools
 import h5py
 import re
 import numpy as np
 
 from .exception import JhdfError
 
-__all__ = ["atleast_nd", "dsetChunk", "hobjAttrsDict", "hobjContentsDict", "hobjMetaDict", "hobjType", "jsonize", "parseIndex", "parseSubindex", "slicelen", "shapemeta", "uriJoin", "uriName"]
+__all__ = ["atleast_nd", "dsetChunk", "groupContentsDicts", "hobjAttrsDict", "hobjContentsDict", "hobjMetaDict", "hobjType", "jsonDefault", "jsonize", "parseIndex", "parseSubindex", "slicelen", "shapemeta", "uriJoin", "uriName"]
 
 ## array handling
 def atleast_nd(ary, ndim, pos=0):
@@ -53,8 +54,12 @@ def dsetChunk(dset, ixstr=None, subixstr=None, min_ndim=None):
     elif subixstr is None:
         chunk = dset[parseIndex(ixstr)]
     else:
-        validateSubindex(dset.shape, dset.size, ixstr, subixstr)
-        chunk = dset[parseSubindex(dset.shape, dset.size, ixstr, subixstr)]
+        # compute the shape metadata and parse the subindex only once, and
+        # share them between the validation and the compound index
+        meta = shapemeta(dset.shape, dset.size, ixstr)
+        subix = parseIndex(subixstr)
+        _validateSubindex(meta, subix, ixstr, subixstr)
+        chunk = dset[_compoundIndex(parseIndex(ixstr), meta, subix)]
 
     if min_ndim is not None:
         chunk = atleast_nd(chunk, min_ndim)
@@ -64,79 +69,128 @@ def dsetChunk(dset, ixstr=None, subixstr=None, min_ndim=None):
 
 ## create dicts to be returned by the various api
 def hobjAttrsDict(hobj, attr_keys=None):
+    # each access of hobj.attrs creates a new AttributeManager, so fetch it once
+    attrs = hobj.attrs
     if attr_keys is None:
-        return dict((*hobj.attrs.items(),))
+        return {key: attrs[key] for key in attrs}
 
-    return dict((key, hobj.attrs[key]) for key in attr_keys)
+    return {key: attrs[key] for key in attr_keys}
+
+
+def groupContentsDicts(group):
+    """Build the contents dicts of the direct children of a group. Only the
+    type of each child is looked up, so the children are never opened.
+    """
+    # join the child uris inline, the root group already ends in a slash
+    prefix = group.name.rstrip("/") + "/"
+
+    # bind the per-child lookups once, outside of the loop
+    gid = group.id
+    getInfo = h5py.h5o.get_info
+    infoType = _hobjInfoTypes.get
+
+    # read each child's object type with one low-level H5Oget_info call on the
+    # raw link name, skipping the name checks and class mapping of Group.get
+    contents = []
+    for bname in gid:
+        name = bname.decode("utf8")
+        contents.append({"name": name, "type": infoType(getInfo(gid, bname).type, "other"), "uri": prefix + name})
+
+    return contents
 
 
 def hobjContentsDict(hobj, content=False, ixstr=None, min_ndim=None):
-    return dict(
-        (
-            # ensure that 'content' is undefined if not explicitly requested
-            *((("content", hobjMetaDict(hobj, ixstr=ixstr, min_ndim=min_ndim)),) if content else ()),
-            *_hobjDict(hobj).items(),
-            ("uri", hobj.name),
-        )
-    )
+    # hobj.name is a libhdf5 call, so look it up (and the type) only once
+    uri = hobj.name
+    hobjDict = _hobjDict(hobj, uri=uri)
 
+    # ensure that 'content' is undefined if not explicitly requested
+    if content:
+        return {
+            "content": _hobjMetaDict(hobj, hobjDict, ixstr=ixstr, min_ndim=min_ndim),
+            "name": hobjDict["name"],
+            "type": hobjDict["type"],
+            "uri": uri,
+        }
+    return {"name": hobjDict["name"], "type": hobjDict["type"], "uri": uri}
 
-def hobjMetaDict(hobj, ixstr=None, min_ndim=None):
-    d = dict((*_hobjDict(hobj).items(), ("attributes", [_attrMetaDict(hobj.attrs.get_id(k)) for k in sorted(hobj.attrs.keys())])))
 
-    if d["type"] == "dataset":
-        return dict(
-            sorted(
-                (
-                    *d.items(),
-                    *_dsetMetaDict(hobj, ixstr=ixstr, min_ndim=min_ndim).items(),
-                )
-            )
-        )
-    elif d["type"] == "group":
-        return dict(sorted((*d.items(), ("childrenCount", len(hobj)))))
+def hobjMetaDict(hobj, ixstr=None, min_ndim=None):
+    return _hobjMetaDict(hobj, _hobjDict(hobj), ixstr=ixstr, min_ndim=min_ndim)
+
+
+def _hobjMetaDict(hobj, hobjDict, ixstr=None, min_ndim=None):
+    attributes = _attrsMetaList(hobj.id)
+
+    # the keys of each dict literal below are already in sorted order
+    if hobjDict["type"] == "dataset":
+        smeta = shapemeta(hobj.shape, hobj.size, ixstr=ixstr, min_ndim=min_ndim)
+        return {
+            "attributes": attributes,
+            "dtype": hobj.dtype.str,
+            "labels": smeta["labels"],
+            "name": hobjDict["name"],
+            "ndim": smeta["ndim"],
+            "shape": smeta["shape"],
+            "size": smeta["size"],
+            "type": hobjDict["type"],
+        }
+    elif hobjDict["type"] == "group":
+        return {
+            "attributes": attributes,
+            "childrenCount": len(hobj),
+            "name": hobjDict["name"],
+            "type": hobjDict["type"],
+        }
     else:
-        return d
+        return {"name": hobjDict["name"], "type": hobjDict["type"], "attributes": attributes}
 
 
 def hobjType(hobj):
-    if isinstance(hobj, h5py.Dataset):
-        return "dataset"
-    elif isinstance(hobj, h5py.Group):
-        return "group"
-    else:
-        return "other"
+    return _hobjClassTypes.get(type(hobj), "other")
 
 
-def _attrMetaDict(attrId):
-    return dict(
-        (
-            ("name", attrId.name),
-            ("dtype", attrId.dtype.str),
-            ("shape", attrId.shape),
-        )
+# h5py returns exactly these classes for opened objects, so a single lookup on
+# the class replaces a chain of isinstance checks
+_hobjClassTypes = dict(
+    (
+        (h5py.Dataset, "dataset"),
+        (h5py.File, "group"),
+        (h5py.Group, "group"),
     )
+)
 
 
-def _dsetMetaDict(dset, ixstr=None, min_ndim=None):
-    shapekeys = ("labels", "ndim", "shape", "size")
-    smeta = {k: v for k, v in shapemeta(dset.shape, dset.size, ixstr=ixstr, min_ndim=min_ndim).items() if k in shapekeys}
-
-    return dict(
-        (
-            ("dtype", dset.dtype.str),
-            *smeta.items(),
-        )
+# the same mapping, keyed on the object type codes of h5o.get_info
+_hobjInfoTypes = dict(
+    (
+        (h5py.h5o.TYPE_DATASET, "dataset"),
+        (h5py.h5o.TYPE_GROUP, "group"),
     )
+)
 
 
-def _hobjDict(hobj):
-    return dict(
-        (
-            ("name", uriName(hobj.name)),
-            ("type", hobjType(hobj)),
-        )
-    )
+def _attrsMetaList(oid):
+    """Build the metadata dicts of all attributes of an object in one pass,
+    sorted by name. The sorted names are collected with a single iteration
+    over the name index, then each attribute is opened by its name.
+    """
+    names = []
+    h5py.h5a.iterate(oid, names.append, index_type=h5py.h5.INDEX_NAME, order=h5py.h5.ITER_INC)
+
+    # bind the per-attribute lookups once, outside of the loop
+    attrOpen = h5py.h5a.open
+    attrMetas = []
+    appendMeta = attrMetas.append
+    for name in names:
+        attrId = attrOpen(oid, name)
+        appendMeta({"name": attrId.name, "dtype": attrId.dtype.str, "shape": attrId.shape})
+
+    return attrMetas
+
+
+def _hobjDict(hobj, uri=None):
+    return {"name": uriName(hobj.name if uri is None else uri), "type": hobjType(hobj)}
 
 
 ## index parsing and handling
@@ -152,6 +206,9 @@ class _Guard:
             return False
 
 
+# the frontend requests many subindexes of the same index, so cache the parsed
+# results. They are made of immutable tuples/slices and are safe to share
+@functools.lru_cache(maxsize=256)
 def parseIndex(node_or_string):
     """Safely evaluate an expression node or a string containing
     a (limited subset) of valid numpy index or slice expressions.
@@ -230,10 +287,10 @@ def parseIndex(node_or_string):
 
 
 def parseSubindex(shape, size, ixstr, subixstr):
-    ix = parseIndex(ixstr)
-    meta = shapemeta(shape, size, ixstr)
-    subix = parseIndex(subixstr)
+    return _compoundIndex(parseIndex(ixstr), shapemeta(shape, size, ixstr), parseIndex(subixstr))
+
 
+def _compoundIndex(ix, meta, subix):
     ixcompound = list(ix)
     for d, dlabel, subdix in zip(meta["visdims"], meta["labels"], subix):
         start = dlabel.start + (subdix.start * dlabel.step)
@@ -268,10 +325,18 @@ def shapemeta(shape, size, ixstr=None, min_ndim=None):
         ndimIx += promote
         shape = (1,) * promote + shape
 
-    visdimsIx = tuple(d for d, dix in enumerate(ix) if isinstance(dix, slice))
-
-    labelsIx = [slice(*ix[d].indices(shape[d])) for d in visdimsIx]
-    shapeIx = [slicelen(ix[d], shape[d]) for d in visdimsIx]
+    # resolve each visible slice against its axis only once, and get the
+    # label and the length of the axis from the same resolved range
+    visdimsIx = []
+    labelsIx = []
+    shapeIx = []
+    for d, dix in enumerate(ix):
+        if isinstance(dix, slice):
+            rng = range(*dix.indices(shape[d]))
+            visdimsIx.append(d)
+            labelsIx.append(slice(rng.start, rng.stop, rng.step))
+            shapeIx.append(len(rng))
+    visdimsIx = tuple(visdimsIx)
 
     sizeIx = np.prod(shapeIx) if ndimIx else size
 
@@ -293,9 +358,10 @@ def slicelen(slyce, seqlen):
 
 
 def validateSubindex(shape, size, ixstr, subixstr):
-    meta = shapemeta(shape, size, ixstr)
-    subix = parseIndex(subixstr)
+    _validateSubindex(shapemeta(shape, size, ixstr), parseIndex(subixstr), ixstr, subixstr)
+
 
+def _validateSubindex(meta, subix, ixstr, subixstr):
     if len(subix) != len(meta["visdims"]):
         msg = dict(
             (
@@ -307,6 +373,22 @@ def validateSubindex(shape, size, ixstr, subixstr):
 
 
 ## json handling
+def jsonDefault(v):
+    """Serializer hook that turns a single value that json does not handle
+    natively into a serializable version. Pass as the `default` arg of
+    `simplejson.dumps`, which calls it again on any nested values.
+    """
+    if isinstance(v, np.generic) or isinstance(v, np.ndarray):
+        return v.tolist()
+    if isinstance(v, slice):
+        return {"start": v.start, "stop": v.stop, "step": v.step}
+    if isinstance(v, complex):
+        return [v.real, v.imag]
+    if isinstance(v, h5py.Empty):
+        return None
+    raise TypeError(f"Object of type {type(v).__name__} is not JSON serializable")
+
+
 def jsonize(v):
     """Turns a value into a JSON serializable version"""
     if isinstance(v, bytes):
@@ -341,4 +423,4 @@ def uriJoin(*parts):
 
 
 def uriName(uri):
-    return uri.split("/")[-1]
+    return uri.rpartition("/")[2]